@@ -1,7 +1,10 @@
+import asyncio
+from functools import lru_cache
 from pathlib import Path
 import json
 from typing import Any
 
+import orjson
 import weave
 
 from app.config import get_settings
@@ -14,10 +17,14 @@ FALLBACK_BRAINSTORMING_PROMPT = (
     "and keep outputs concrete and testable."
 )
 
+_SETTINGS = get_settings()
+_JSON_DECODER = json.JSONDecoder()
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
 
+
+@lru_cache(maxsize=1)
 def _load_brainstorming_prompt() -> str:
-    settings = get_settings()
-    prompt_path = Path(settings.brainstorming_skill_path)
+    prompt_path = Path(_SETTINGS.brainstorming_skill_path)
 
     if prompt_path.exists() and prompt_path.is_file():
         content = prompt_path.read_text(encoding="utf-8").strip()
@@ -35,6 +42,7 @@ async def run_brainstorming_agent(
 
     completion = await chat_completion(
         model=model,
+        use_cache=True,
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": task},
@@ -42,7 +50,7 @@ async def run_brainstorming_agent(
     )
 
     assistant_message = completion["choices"][0]["message"]["content"]
-    model_name = completion.get("model", model or get_settings().openrouter_model)
+    model_name = completion.get("model", model or _SETTINGS.openrouter_model)
 
     return {
         "model": model_name,
@@ -50,18 +58,40 @@ async def run_brainstorming_agent(
     }
 
 
+def _is_truncated(exc: json.JSONDecodeError, text: str) -> bool:
+    return exc.pos >= len(text) or exc.msg.startswith("Unterminated string")
+
+
 def _parse_json_output(text: str) -> dict[str, Any]:
+    return _decode_json_output(text)[0]
+
+
+def _decode_json_output(text: str) -> tuple[dict[str, Any], str]:
+    """Decode model output and return the object with the JSON text it came from."""
     cleaned = text.strip()
     if cleaned.startswith("```"):
-        lines = cleaned.splitlines()
-        cleaned = "\n".join(lines[1:-1]).strip()
+        body_start = cleaned.find("\n") + 1
+        body_end = cleaned.rfind("```")
+        if body_end < body_start:
+            body_end = len(cleaned)
+        cleaned = cleaned[body_start:body_end].strip()
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
+        return orjson.loads(cleaned), cleaned
+    except orjson.JSONDecodeError:
+        # Models sometimes wrap the object in prose; try each opening brace in
+        # turn and keep the first one that decodes to a complete object.
         start = cleaned.find("{")
-        end = cleaned.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            return json.loads(cleaned[start : end + 1])
+        while start != -1:
+            try:
+                parsed, end = _JSON_DECODER.raw_decode(cleaned, start)
+            except json.JSONDecodeError as exc:
+                # Output cut off mid-object must not fall back to a nested
+                # fragment that happens to decode.
+                if _is_truncated(exc, cleaned):
+                    raise
+                start = cleaned.find("{", start + 1)
+            else:
+                return parsed, cleaned[start:end]
         raise
 
 
@@ -71,48 +101,57 @@ async def run_brainstorming_full_flow(
 ) -> dict[str, Any]:
     system_prompt = _load_brainstorming_prompt()
 
-    synthetic_data_response = await chat_completion(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {
-                "role": "user",
-                "content": (
-                    "Task: "
-                    f"{task}\n\n"
-                    "Generate synthetic_data.json as strict JSON only. "
-                    "Return an object with a top-level 'cases' array of realistic test inputs."
-                ),
-            },
-        ],
+    # The criteria prompt is conditioned on the task alone so both artifacts can
+    # be generated concurrently; only the prompt template waits on the rubric.
+    synthetic_data_response, judging_criteria_response = await asyncio.gather(
+        chat_completion(
+            model=model,
+            use_cache=True,
+            response_format=_JSON_RESPONSE_FORMAT,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {
+                    "role": "user",
+                    "content": (
+                        "Task: "
+                        f"{task}\n\n"
+                        "Generate synthetic_data.json as strict JSON only. "
+                        "Return an object with a top-level 'cases' array of realistic test inputs."
+                    ),
+                },
+            ],
+        ),
+        chat_completion(
+            model=model,
+            use_cache=True,
+            response_format=_JSON_RESPONSE_FORMAT,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {
+                    "role": "user",
+                    "content": (
+                        "Task: "
+                        f"{task}\n\n"
+                        "Generate judging_criteria.json as strict JSON only. "
+                        "Return an object with a top-level 'rubric' array and numeric weights."
+                    ),
+                },
+            ],
+        ),
     )
     synthetic_data_text = synthetic_data_response["choices"][0]["message"]["content"]
     synthetic_data = _parse_json_output(synthetic_data_text)
 
-    judging_criteria_response = await chat_completion(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {
-                "role": "user",
-                "content": (
-                    "Task: "
-                    f"{task}\n\n"
-                    "Synthetic data:\n"
-                    f"{json.dumps(synthetic_data)}\n\n"
-                    "Generate judging_criteria.json as strict JSON only. "
-                    "Return an object with a top-level 'rubric' array and numeric weights."
-                ),
-            },
-        ],
-    )
     judging_criteria_text = judging_criteria_response["choices"][0]["message"][
         "content"
     ]
-    judging_criteria = _parse_json_output(judging_criteria_text)
+    judging_criteria, judging_criteria_json = _decode_json_output(
+        judging_criteria_text
+    )
 
     prompt_template_response = await chat_completion(
         model=model,
+        use_cache=True,
         messages=[
             {"role": "system", "content": system_prompt},
             {
@@ -121,7 +160,9 @@ async def run_brainstorming_full_flow(
                     "Task: "
                     f"{task}\n\n"
                     "Judging criteria:\n"
-                    f"{json.dumps(judging_criteria)}\n\n"
+                    # The decoded slice, free of fences and prose; no need to
+                    # re-serialize the dict.
+                    f"{judging_criteria_json}\n\n"
                     "Generate prompt_template.md as markdown."
                 ),
             },
@@ -132,7 +173,7 @@ async def run_brainstorming_full_flow(
     model_name = (
         prompt_template_response.get("model")
         or model
-        or get_settings().openrouter_model
+        or _SETTINGS.openrouter_model
     )
 
     return {
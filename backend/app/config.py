@@ -1,13 +1,13 @@
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore"
+        env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True
     )
 
     app_name: str = "OmniTrace Backend"
@@ -22,6 +22,13 @@ class Settings(BaseSettings):
         default="openai/gpt-4o-mini", alias="OPENROUTER_MODEL"
     )
 
+    openrouter_max_concurrency: int = Field(
+        default=8, ge=1, alias="OPENROUTER_MAX_CONCURRENCY"
+    )
+    openrouter_max_attempts: int = Field(
+        default=5, ge=1, alias="OPENROUTER_MAX_ATTEMPTS"
+    )
+
     openrouter_site_url: str = Field(
         default="http://localhost:8000", alias="OPENROUTER_SITE_URL"
     )
@@ -35,11 +42,12 @@ class Settings(BaseSettings):
         alias="BRAINSTORMING_SKILL_PATH",
     )
 
+    @field_validator("brainstorming_skill_path", mode="after")
+    @classmethod
+    def _expand_skill_path(cls, value: str) -> str:
+        return str(Path(value).expanduser())
+
 
 @lru_cache
 def get_settings() -> Settings:
-    settings = Settings()
-    settings.brainstorming_skill_path = str(
-        Path(settings.brainstorming_skill_path).expanduser()
-    )
-    return settings
+    return Settings()
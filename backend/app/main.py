@@ -7,6 +7,7 @@ from app.agents.brainstorming_agent import (
     run_brainstorming_full_flow,
 )
 from app.config import get_settings
+from app.openrouter_client import close_http_client
 from app.routers import benchmarks, planner, runs
 from app.schemas import (
     BrainstormFullFlowResponse,
@@ -18,8 +19,9 @@ from app.telemetry import init_weave
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    init_weave()
+    await init_weave()
     yield
+    await close_http_client()
 
 
 settings = get_settings()
@@ -1,19 +1,200 @@
+import asyncio
+from collections import OrderedDict
+import hashlib
+import random
+import time
 from typing import Any
 
 import httpx
+import orjson
 import weave
 
 from app.config import get_settings
 
 
+_SETTINGS = get_settings()
+
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+_RETRY_BASE_DELAY_SECONDS = 0.5
+_RETRY_MAX_DELAY_SECONDS = 30.0
+
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+_RESPONSE_CACHE_TTL_SECONDS = 600.0
+_RESPONSE_CACHE: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+class _AdmissionController:
+    """Caps in-flight requests with a limit that adapts to rate limiting.
+
+    The limit is halved when OpenRouter answers 429 and grows back by one on
+    each success, up to the configured maximum. Entering returns the limit the
+    request was admitted under, so a burst of 429s from one window halves the
+    limit once rather than once per response.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.limit = self.max_concurrent
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> int:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            return self.limit
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        # Release the slot before awaiting anything, and shield the wakeup so a
+        # cancelled exit still lets queued requests in.
+        self.in_flight -= 1
+        await asyncio.shield(self._wake_waiters())
+
+    async def _wake_waiters(self) -> None:
+        # Wake every waiter rather than one: a notified waiter that is cancelled
+        # before reacquiring the lock would otherwise swallow the wakeup.
+        # wait_for rechecks the predicate, so extra wakeups are harmless.
+        async with self._cond:
+            self._cond.notify_all()
+
+    async def resize(self, limit: int) -> None:
+        async with self._cond:
+            self.limit = max(1, min(limit, self.max_concurrent))
+            self._cond.notify_all()
+
+    async def on_rate_limited(self, admitted_limit: int) -> None:
+        await self.resize(min(self.limit, admitted_limit // 2))
+
+    async def on_success(self) -> None:
+        if self.limit < self.max_concurrent:
+            await self.resize(self.limit + 1)
+
+
+_ADMISSION: _AdmissionController | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is None:
+        # One pooled HTTP/2 client lets concurrent agent calls multiplex over a
+        # single connection instead of paying a TLS handshake per request.
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+def _get_admission() -> _AdmissionController:
+    global _ADMISSION
+
+    if _ADMISSION is None:
+        _ADMISSION = _AdmissionController(_SETTINGS.openrouter_max_concurrency)
+    return _ADMISSION
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), _RETRY_MAX_DELAY_SECONDS)
+            except ValueError:
+                pass
+
+    backoff = min(_RETRY_BASE_DELAY_SECONDS * 2**attempt, _RETRY_MAX_DELAY_SECONDS)
+    return backoff + random.uniform(0, _RETRY_BASE_DELAY_SECONDS)
+
+
+async def _post_with_retry(
+    url: str, payload: dict[str, Any], headers: dict[str, str], max_attempts: int
+) -> httpx.Response:
+    client = _get_http_client()
+    admission = _get_admission()
+
+    for attempt in range(max_attempts):
+        is_last_attempt = attempt == max_attempts - 1
+        try:
+            # Only the request itself holds a slot; backoff sleeps do not.
+            async with admission as admitted_limit:
+                response = await client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            await admission.on_success()
+            return response
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 429:
+                await admission.on_rate_limited(admitted_limit)
+            if (
+                exc.response.status_code not in _RETRYABLE_STATUS_CODES
+                or is_last_attempt
+            ):
+                raise
+            delay = _retry_delay(attempt, exc.response)
+        except httpx.TransportError:
+            if is_last_attempt:
+                raise
+            delay = _retry_delay(attempt, None)
+
+        await asyncio.sleep(delay)
+
+    raise RuntimeError("max_attempts must be at least 1")
+
+
+def _response_cache_key(payload: dict[str, Any]) -> str:
+    encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _get_cached_response(key: str) -> dict[str, Any] | None:
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None:
+        return None
+
+    expires_at, response = entry
+    if expires_at <= time.monotonic():
+        del _RESPONSE_CACHE[key]
+        return None
+
+    _RESPONSE_CACHE.move_to_end(key)
+    return response
+
+
+def _store_cached_response(key: str, response: dict[str, Any]) -> None:
+    _RESPONSE_CACHE[key] = (time.monotonic() + _RESPONSE_CACHE_TTL_SECONDS, response)
+    _RESPONSE_CACHE.move_to_end(key)
+    while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX_ENTRIES:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
 @weave.op
 async def chat_completion(
-    messages: list[dict[str, str]], model: str | None = None
+    messages: list[dict[str, str]],
+    model: str | None = None,
+    response_format: dict[str, Any] | None = None,
+    use_cache: bool = False,
 ) -> dict[str, Any]:
-    settings = get_settings()
-    selected_model = model or settings.openrouter_model
+    """Send a chat completion request to OpenRouter and return the decoded body.
+
+    Caching is opt-in. Benchmark repetitions rely on repeated calls producing
+    independent samples, so only callers for whom an identical answer is
+    acceptable should pass ``use_cache=True``. Cache hits return the stored
+    dict itself, so callers must not mutate the result.
+    """
+    selected_model = model or _SETTINGS.openrouter_model
 
-    if not settings.openrouter_api_key:
+    if not _SETTINGS.openrouter_api_key:
         raise ValueError("OPENROUTER_API_KEY is not set")
 
     payload = {
@@ -21,20 +202,30 @@ async def chat_completion(
         "messages": messages,
         "temperature": 0.2,
     }
+    if response_format is not None:
+        payload["response_format"] = response_format
+
+    cache_key = _response_cache_key(payload) if use_cache else None
+    if cache_key is not None:
+        cached = _get_cached_response(cache_key)
+        if cached is not None:
+            return cached
 
     headers = {
-        "Authorization": f"Bearer {settings.openrouter_api_key}",
+        "Authorization": f"Bearer {_SETTINGS.openrouter_api_key}",
         "Content-Type": "application/json",
-        "HTTP-Referer": settings.openrouter_site_url,
-        "X-Title": settings.openrouter_site_name,
+        "HTTP-Referer": _SETTINGS.openrouter_site_url,
+        "X-Title": _SETTINGS.openrouter_site_name,
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"{settings.openrouter_base_url}/chat/completions",
-            json=payload,
-            headers=headers,
-        )
-        response.raise_for_status()
+    response = await _post_with_retry(
+        f"{_SETTINGS.openrouter_base_url}/chat/completions",
+        payload,
+        headers,
+        max_attempts=_SETTINGS.openrouter_max_attempts,
+    )
 
-    return response.json()
+    completion = orjson.loads(response.content)
+    if cache_key is not None:
+        _store_cached_response(cache_key, completion)
+    return completion
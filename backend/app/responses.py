@@ -0,0 +1,16 @@
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(content: Any) -> Response:
+    """Encode ``content`` with orjson and return it without FastAPI re-validating.
+
+    Routes keep their ``response_model`` for the OpenAPI schema; a returned
+    ``Response`` is passed through as-is.
+    """
+    return Response(orjson.dumps(content), media_type=JSON_MEDIA_TYPE)
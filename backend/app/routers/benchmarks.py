@@ -1,12 +1,13 @@
 from uuid import uuid4
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
+from app.responses import json_response
 from app.schemas import CreateBenchmarkRequest, CreateBenchmarkResponse
 
 router = APIRouter()
 
 
 @router.post("/benchmarks", response_model=CreateBenchmarkResponse)
-async def create_benchmark(payload: CreateBenchmarkRequest) -> CreateBenchmarkResponse:
-    return CreateBenchmarkResponse(benchmark_id=uuid4())
+async def create_benchmark(payload: CreateBenchmarkRequest) -> Response:
+    return json_response({"benchmark_id": uuid4()})
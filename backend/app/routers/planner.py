@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
+from app.responses import JSON_MEDIA_TYPE
 from app.schemas import (
     PlannerChatRequest,
     PlannerChatResponse,
@@ -10,14 +12,23 @@ from app.schemas import (
 router = APIRouter()
 
 
-@router.post("/chat", response_model=PlannerChatResponse)
-async def planner_chat(payload: PlannerChatRequest) -> PlannerChatResponse:
-    return PlannerChatResponse(
+# Stub payloads are encoded once at import; see routers/runs.py.
+_PLANNER_CHAT_BODY = orjson.dumps(
+    PlannerChatResponse(
         assistant_message="Stub: planning response",
         draft_spec=None,
-    )
+    ).model_dump()
+)
+_PLANNER_VALIDATE_BODY = orjson.dumps(
+    ValidateSpecResponse(valid=True, errors=[]).model_dump()
+)
+
+
+@router.post("/chat", response_model=PlannerChatResponse)
+async def planner_chat(payload: PlannerChatRequest) -> Response:
+    return Response(_PLANNER_CHAT_BODY, media_type=JSON_MEDIA_TYPE)
 
 
 @router.post("/validate", response_model=ValidateSpecResponse)
-async def planner_validate(payload: ValidateSpecRequest) -> ValidateSpecResponse:
-    return ValidateSpecResponse(valid=True, errors=[])
+async def planner_validate(payload: ValidateSpecRequest) -> Response:
+    return Response(_PLANNER_VALIDATE_BODY, media_type=JSON_MEDIA_TYPE)
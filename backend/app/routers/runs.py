@@ -1,12 +1,13 @@
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import APIRouter, Query, Response, WebSocket, WebSocketDisconnect
 
+from app.responses import JSON_MEDIA_TYPE, json_response
 from app.schemas import (
     AnalysisChatRequest,
     AnalysisChatResponse,
     LeaderboardEntry,
-    ModelBreakdown,
     ModelStatus,
     PromptBreakdownResponse,
     RunMetricsResponse,
@@ -19,27 +20,66 @@ from app.schemas import (
 router = APIRouter()
 
 
-@router.post("", response_model=StartRunResponse)
-async def start_run(payload: StartRunRequest) -> StartRunResponse:
-    return StartRunResponse(run_id=uuid4(), status="running")
-
-
-@router.get("/{run_id}", response_model=RunStatusResponse)
-async def get_run_status(run_id: UUID) -> RunStatusResponse:
-    return RunStatusResponse(
+# Stub payloads never change, so they are validated against their schemas and
+# encoded once at import. Returning a Response skips FastAPI's per-request
+# validation and serialization; response_model on the route still documents
+# the shape.
+_RUN_STATUS_BODY = orjson.dumps(
+    RunStatusResponse(
         status="running",
         progress=0.0,
         total_tasks=200,
         completed_tasks=0,
-    )
+    ).model_dump()
+)
+_RUN_MODELS_BODY = orjson.dumps(
+    [
+        ModelStatus(model="gpt-4o", avg_score=0.0, completed=0, total=20).model_dump(),
+        ModelStatus(
+            model="claude-3-sonnet", avg_score=0.0, completed=0, total=20
+        ).model_dump(),
+    ]
+)
+_RUN_RESULTS_BODY = orjson.dumps(
+    RunResultsResponse(prompt="Stub prompt", runs=[]).model_dump()
+)
+_LEADERBOARD_BODY = orjson.dumps(
+    [
+        LeaderboardEntry(
+            model="gpt-4o",
+            mean_score=0.0,
+            std_dev=0.0,
+            hallucination_rate=0.0,
+            cost_total=0.0,
+            latency_p50=0,
+        ).model_dump(),
+    ]
+)
+_RUN_METRICS_BODY = orjson.dumps(
+    RunMetricsResponse(
+        cost_vs_score=[],
+        stability_data=[],
+        hallucination_rates=[],
+    ).model_dump()
+)
+_ANALYSIS_CHAT_BODY = orjson.dumps(
+    AnalysisChatResponse(response="Stub: analysis response").model_dump()
+)
+
+
+@router.post("", response_model=StartRunResponse)
+async def start_run(payload: StartRunRequest) -> Response:
+    return json_response({"run_id": uuid4(), "status": "running"})
+
+
+@router.get("/{run_id}", response_model=RunStatusResponse)
+async def get_run_status(run_id: UUID) -> Response:
+    return Response(_RUN_STATUS_BODY, media_type=JSON_MEDIA_TYPE)
 
 
 @router.get("/{run_id}/models", response_model=list[ModelStatus])
-async def get_run_models(run_id: UUID) -> list[ModelStatus]:
-    return [
-        ModelStatus(model="gpt-4o", avg_score=0.0, completed=0, total=20),
-        ModelStatus(model="claude-3-sonnet", avg_score=0.0, completed=0, total=20),
-    ]
+async def get_run_models(run_id: UUID) -> Response:
+    return Response(_RUN_MODELS_BODY, media_type=JSON_MEDIA_TYPE)
 
 
 @router.get("/{run_id}/results", response_model=RunResultsResponse)
@@ -47,8 +87,8 @@ async def get_run_results(
     run_id: UUID,
     model: str | None = Query(default=None),
     prompt_id: int | None = Query(default=None),
-) -> RunResultsResponse:
-    return RunResultsResponse(prompt="Stub prompt", runs=[])
+) -> Response:
+    return Response(_RUN_RESULTS_BODY, media_type=JSON_MEDIA_TYPE)
 
 
 @router.websocket("/{run_id}/stream")
@@ -64,41 +104,28 @@ async def run_stream(websocket: WebSocket, run_id: str) -> None:
 
 
 @router.get("/{run_id}/leaderboard", response_model=list[LeaderboardEntry])
-async def get_leaderboard(run_id: UUID) -> list[LeaderboardEntry]:
-    return [
-        LeaderboardEntry(
-            model="gpt-4o",
-            mean_score=0.0,
-            std_dev=0.0,
-            hallucination_rate=0.0,
-            cost_total=0.0,
-            latency_p50=0,
-        ),
-    ]
+async def get_leaderboard(run_id: UUID) -> Response:
+    return Response(_LEADERBOARD_BODY, media_type=JSON_MEDIA_TYPE)
 
 
 @router.get("/{run_id}/metrics", response_model=RunMetricsResponse)
-async def get_run_metrics(run_id: UUID) -> RunMetricsResponse:
-    return RunMetricsResponse(
-        cost_vs_score=[],
-        stability_data=[],
-        hallucination_rates=[],
-    )
+async def get_run_metrics(run_id: UUID) -> Response:
+    return Response(_RUN_METRICS_BODY, media_type=JSON_MEDIA_TYPE)
 
 
 @router.get("/{run_id}/prompts/{prompt_id}", response_model=PromptBreakdownResponse)
-async def get_prompt_breakdown(run_id: UUID, prompt_id: int) -> PromptBreakdownResponse:
-    return PromptBreakdownResponse(
-        prompt_id=prompt_id,
-        prompt="Stub prompt",
-        models=[
-            ModelBreakdown(model="gpt-4o", scores=[], avg_score=0.0),
-        ],
+async def get_prompt_breakdown(run_id: UUID, prompt_id: int) -> Response:
+    return json_response(
+        {
+            "prompt_id": prompt_id,
+            "prompt": "Stub prompt",
+            "models": [
+                {"model": "gpt-4o", "scores": [], "avg_score": 0.0},
+            ],
+        }
     )
 
 
 @router.post("/{run_id}/analysis/chat", response_model=AnalysisChatResponse)
-async def analysis_chat(
-    run_id: UUID, payload: AnalysisChatRequest
-) -> AnalysisChatResponse:
-    return AnalysisChatResponse(response="Stub: analysis response")
+async def analysis_chat(run_id: UUID, payload: AnalysisChatRequest) -> Response:
+    return Response(_ANALYSIS_CHAT_BODY, media_type=JSON_MEDIA_TYPE)
@@ -1,17 +1,29 @@
+import asyncio
+
 import weave
 
 from app.config import get_settings
 
 
-_WEAVE_INITIALIZED = False
+_WEAVE_INIT_TASK: asyncio.Task[None] | None = None
 
 
-def init_weave() -> None:
-    global _WEAVE_INITIALIZED
+async def init_weave() -> None:
+    global _WEAVE_INIT_TASK
 
-    if _WEAVE_INITIALIZED:
-        return
+    # Concurrent callers share a single initialisation. weave.init performs
+    # blocking network I/O, so it runs in a worker thread off the event loop.
+    if _WEAVE_INIT_TASK is None:
+        settings = get_settings()
+        _WEAVE_INIT_TASK = asyncio.create_task(
+            asyncio.to_thread(weave.init, settings.weave_project)
+        )
 
-    settings = get_settings()
-    weave.init(settings.weave_project)
-    _WEAVE_INITIALIZED = True
+    init_task = _WEAVE_INIT_TASK
+    try:
+        await asyncio.shield(init_task)
+    except Exception:
+        # Let a later call retry after a failed handshake.
+        if _WEAVE_INIT_TASK is init_task and init_task.done():
+            _WEAVE_INIT_TASK = None
+        raise
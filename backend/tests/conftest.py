@@ -0,0 +1,11 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    # Not entered as a context manager: the lifespan would initialise Weave
+    # against the real backend, and the routes under test do not need it.
+    return TestClient(app)
@@ -0,0 +1,9 @@
+from app.schemas import CreateBenchmarkResponse
+
+
+def test_create_benchmark_matches_response_model(client):
+    response = client.post("/api/benchmarks", json={"spec": {}})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    CreateBenchmarkResponse.model_validate(response.json())
@@ -5,63 +5,74 @@ import pytest
 from app.agents import brainstorming_agent
 
 
-@pytest.mark.asyncio
-async def test_run_brainstorming_full_flow_returns_three_artifacts(monkeypatch):
-    responses = iter(
-        [
-            {
-                "model": "openai/gpt-4o-mini",
-                "choices": [
-                    {
-                        "message": {
-                            "content": json.dumps(
-                                {
-                                    "cases": [
-                                        {
-                                            "id": "c1",
-                                            "input": "email set",
-                                            "expected": "top 3 summary",
-                                        }
-                                    ]
-                                }
-                            )
-                        }
-                    }
-                ],
-            },
-            {
-                "model": "openai/gpt-4o-mini",
-                "choices": [
+# Canned completions in the order the full flow requests them. The agent only
+# reads these, so the same objects are shared rather than rebuilt per test.
+_SYNTHETIC_DATA_COMPLETION = {
+    "model": "openai/gpt-4o-mini",
+    "choices": [
+        {
+            "message": {
+                "content": json.dumps(
                     {
-                        "message": {
-                            "content": json.dumps(
-                                {
-                                    "rubric": [
-                                        {
-                                            "name": "correctness",
-                                            "weight": 0.5,
-                                        }
-                                    ]
-                                }
-                            )
-                        }
+                        "cases": [
+                            {
+                                "id": "c1",
+                                "input": "email set",
+                                "expected": "top 3 summary",
+                            }
+                        ]
                     }
-                ],
-            },
+                )
+            }
+        }
+    ],
+}
+_JUDGING_CRITERIA_JSON = json.dumps(
+    {
+        "rubric": [
             {
-                "model": "openai/gpt-4o-mini",
-                "choices": [
-                    {
-                        "message": {
-                            "content": "# Prompt Template\n\nYou are a reliable assistant.",
-                        }
-                    }
-                ],
-            },
+                "name": "correctness",
+                "weight": 0.5,
+            }
         ]
-    )
+    }
+)
+_JUDGING_CRITERIA_COMPLETION = {
+    "model": "openai/gpt-4o-mini",
+    "choices": [
+        {
+            "message": {
+                # Fenced, as models often return it; only the JSON inside the
+                # fence should reach the prompt template request.
+                "content": f"```json\n{_JUDGING_CRITERIA_JSON}\n```",
+            }
+        }
+    ],
+}
+_PROMPT_TEMPLATE_COMPLETION = {
+    "model": "openai/gpt-4o-mini",
+    "choices": [
+        {
+            "message": {
+                "content": "# Prompt Template\n\nYou are a reliable assistant.",
+            }
+        }
+    ],
+}
+FULL_FLOW_COMPLETIONS = (
+    _SYNTHETIC_DATA_COMPLETION,
+    _JUDGING_CRITERIA_COMPLETION,
+    _PROMPT_TEMPLATE_COMPLETION,
+)
+
 
-    async def fake_chat_completion(messages, model=None):  # noqa: ARG001
+@pytest.mark.asyncio
+async def test_run_brainstorming_full_flow_returns_three_artifacts(monkeypatch):
+    responses = iter(FULL_FLOW_COMPLETIONS)
+    calls = []
+
+    async def fake_chat_completion(messages, **kwargs):
+        calls.append({"messages": messages, **kwargs})
         return next(responses)
 
     monkeypatch.setattr(brainstorming_agent, "chat_completion", fake_chat_completion)
@@ -74,3 +85,47 @@ async def test_run_brainstorming_full_flow_returns_three_artifacts(monkeypatch):
     assert result["synthetic_data"]["cases"][0]["id"] == "c1"
     assert result["judging_criteria"]["rubric"][0]["name"] == "correctness"
     assert "Prompt Template" in result["prompt_template"]
+
+    synthetic_call, criteria_call, template_call = calls
+    assert synthetic_call["response_format"] == {"type": "json_object"}
+    assert criteria_call["response_format"] == {"type": "json_object"}
+    # The criteria are generated from the task alone, concurrently with the data.
+    criteria_prompt = criteria_call["messages"][-1]["content"]
+    assert "email set" not in criteria_prompt
+    assert '"c1"' not in criteria_prompt
+    assert (
+        f"Judging criteria:\n{_JUDGING_CRITERIA_JSON}\n\n"
+        in template_call["messages"][-1]["content"]
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"cases": [{"id": "c1"}]}',
+        '```json\n{"cases": [{"id": "c1"}]}\n```',
+        '```\n{"cases": [{"id": "c1"}]}',
+        'Here you go {draft} :\n{"cases": [{"id": "c1"}]}\nLet me know {if} needed.',
+    ],
+    ids=["bare", "fenced", "unterminated-fence", "prose-wrapped"],
+)
+def test_parse_json_output_recovers_object(text):
+    parsed, json_text = brainstorming_agent._decode_json_output(text)
+
+    assert parsed == {"cases": [{"id": "c1"}]}
+    assert json_text == '{"cases": [{"id": "c1"}]}'
+    assert brainstorming_agent._parse_json_output(text) == parsed
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"cases": [{"id": "c1"}, {"id": "c2"',
+        '```json\n{"rubric": [{"name": "correctness"}, {"name"',
+        '{"cases": [{"id": "c1"}, {"id": "c2", "input": "cut off mid',
+    ],
+    ids=["truncated", "truncated-fenced", "truncated-string"],
+)
+def test_parse_json_output_rejects_truncated_object(text):
+    with pytest.raises(json.JSONDecodeError):
+        brainstorming_agent._parse_json_output(text)
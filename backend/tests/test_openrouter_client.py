@@ -0,0 +1,174 @@
+import asyncio
+from collections import OrderedDict
+
+import httpx
+from pydantic import ValidationError
+import pytest
+
+from app import openrouter_client
+from app.config import Settings
+
+
+class _FakeHttpClient:
+    def __init__(self, statuses=()):
+        self.calls = 0
+        self._statuses = list(statuses)
+
+    async def post(self, url, json, headers):  # noqa: A002, ARG002
+        self.calls += 1
+        status = self._statuses.pop(0) if self._statuses else 200
+        return httpx.Response(
+            status,
+            json={"model": json["model"], "call": self.calls},
+            headers={"Retry-After": "0"},
+            request=httpx.Request("POST", url),
+        )
+
+
+@pytest.fixture
+def install_http_client(monkeypatch):
+    settings = Settings(OPENROUTER_API_KEY="test-key")
+
+    monkeypatch.setattr(openrouter_client, "_SETTINGS", settings)
+    monkeypatch.setattr(openrouter_client, "_RESPONSE_CACHE", OrderedDict())
+    monkeypatch.setattr(
+        openrouter_client, "_ADMISSION", openrouter_client._AdmissionController(4)
+    )
+
+    def install(client):
+        monkeypatch.setattr(openrouter_client, "_get_http_client", lambda: client)
+        return client
+
+    return install
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_caches_only_when_asked(
+    install_http_client,
+):
+    client = install_http_client(_FakeHttpClient())
+    messages = [{"role": "user", "content": "hello"}]
+
+    first = await openrouter_client.chat_completion(
+        messages=messages, model="m", use_cache=True
+    )
+    second = await openrouter_client.chat_completion(
+        messages=messages, model="m", use_cache=True
+    )
+    uncached = await openrouter_client.chat_completion(messages=messages, model="m")
+
+    assert first == second == {"model": "m", "call": 1}
+    assert uncached["call"] == 2
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_retries_rate_limited_requests(install_http_client):
+    client = install_http_client(_FakeHttpClient(statuses=[429, 503]))
+
+    result = await openrouter_client.chat_completion(
+        messages=[{"role": "user", "content": "hello"}], model="m"
+    )
+
+    assert result["call"] == 3
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limiting_shrinks_then_regrows_the_concurrency_limit(
+    install_http_client,
+):
+    install_http_client(_FakeHttpClient(statuses=[429]))
+    admission = openrouter_client._ADMISSION
+
+    await openrouter_client.chat_completion(
+        messages=[{"role": "user", "content": "hello"}], model="m"
+    )
+
+    # Halved to 2 by the 429, then grown back by one on the retried success.
+    assert admission.limit == 3
+    assert admission.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_burst_of_rate_limits_halves_the_limit_once():
+    admission = openrouter_client._AdmissionController(8)
+    admitted_limits = [await admission.__aenter__() for _ in range(8)]
+
+    await asyncio.gather(
+        *(admission.on_rate_limited(limit) for limit in admitted_limits)
+    )
+
+    assert admission.limit == 4
+
+    # A request admitted under the reduced limit is a new congestion event.
+    await admission.on_rate_limited(admission.limit)
+    assert admission.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_does_not_retry_client_errors(install_http_client):
+    client = install_http_client(_FakeHttpClient(statuses=[400]))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await openrouter_client.chat_completion(
+            messages=[{"role": "user", "content": "hello"}], model="m"
+        )
+
+    assert client.calls == 1
+
+
+@pytest.mark.parametrize(
+    "env_var", ["OPENROUTER_MAX_CONCURRENCY", "OPENROUTER_MAX_ATTEMPTS"]
+)
+def test_settings_reject_non_positive_openrouter_limits(env_var):
+    with pytest.raises(ValidationError):
+        Settings(**{env_var: 0})
+
+
+def test_admission_controller_clamps_limit_to_at_least_one():
+    admission = openrouter_client._AdmissionController(0)
+
+    assert admission.max_concurrent == 1
+    assert admission.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_exit_still_admits_a_queued_request():
+    admission = openrouter_client._AdmissionController(1)
+    await admission.__aenter__()
+    waiter = asyncio.create_task(admission.__aenter__())
+    await asyncio.sleep(0)
+
+    # Hold the condition's lock so __aexit__ is cancelled while waiting on it.
+    async with admission._cond:
+        exit_task = asyncio.create_task(admission.__aexit__(None, None, None))
+        await asyncio.sleep(0)
+        exit_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await exit_task
+
+    await asyncio.wait_for(waiter, timeout=1)
+    assert admission.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_swallow_the_wakeup():
+    admission = openrouter_client._AdmissionController(1)
+    await admission.__aenter__()
+    first = asyncio.create_task(admission.__aenter__())
+    second = asyncio.create_task(admission.__aenter__())
+    await asyncio.sleep(0)
+
+    # Cancel the first waiter after the release has notified it but before it
+    # has resumed to take the slot.
+    exit_task = asyncio.create_task(admission.__aexit__(None, None, None))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    first.cancel()
+    await exit_task
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    await asyncio.wait_for(second, timeout=1)
+    assert admission.in_flight == 1
@@ -0,0 +1,21 @@
+from uuid import uuid4
+
+from app.schemas import PlannerChatResponse, ValidateSpecResponse
+
+
+def test_planner_chat_matches_response_model(client):
+    response = client.post(
+        "/api/planner/chat",
+        json={"conversation_id": str(uuid4()), "message": "hello"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    PlannerChatResponse.model_validate(response.json())
+
+
+def test_planner_validate_matches_response_model(client):
+    response = client.post("/api/planner/validate", json={"spec": {}})
+
+    assert response.status_code == 200
+    assert ValidateSpecResponse.model_validate(response.json()).valid
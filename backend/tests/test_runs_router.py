@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+from app.schemas import (
+    LeaderboardEntry,
+    ModelStatus,
+    PromptBreakdownResponse,
+    RunStatusResponse,
+    StartRunResponse,
+)
+
+
+def test_run_status_matches_response_model(client):
+    response = client.get(f"/api/runs/{uuid4()}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    status = RunStatusResponse.model_validate(response.json())
+    assert status.total_tasks == 200
+
+
+def test_run_models_and_leaderboard_match_response_models(client):
+    run_id = uuid4()
+
+    models = client.get(f"/api/runs/{run_id}/models").json()
+    leaderboard = client.get(f"/api/runs/{run_id}/leaderboard").json()
+
+    assert [ModelStatus.model_validate(m).model for m in models] == [
+        "gpt-4o",
+        "claude-3-sonnet",
+    ]
+    assert LeaderboardEntry.model_validate(leaderboard[0]).model == "gpt-4o"
+
+
+def test_start_run_matches_response_model(client):
+    response = client.post(
+        "/api/runs",
+        json={"benchmark_id": str(uuid4()), "models": ["gpt-4o"]},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert StartRunResponse.model_validate(response.json()).status == "running"
+
+
+def test_prompt_breakdown_matches_response_model(client):
+    response = client.get(f"/api/runs/{uuid4()}/prompts/3")
+
+    assert response.status_code == 200
+    breakdown = PromptBreakdownResponse.model_validate(response.json())
+    assert breakdown.prompt_id == 3
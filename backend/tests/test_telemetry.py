@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from app import telemetry
+from app.config import get_settings
+
+
+@pytest.mark.asyncio
+async def test_init_weave_initializes_once_for_concurrent_callers(monkeypatch):
+    calls = []
+    monkeypatch.setattr(telemetry.weave, "init", calls.append)
+    monkeypatch.setattr(telemetry, "_WEAVE_INIT_TASK", None)
+
+    await asyncio.gather(telemetry.init_weave(), telemetry.init_weave())
+    await telemetry.init_weave()
+
+    assert calls == [get_settings().weave_project]
+
+
+@pytest.mark.asyncio
+async def test_init_weave_retries_after_failure(monkeypatch):
+    attempts = []
+
+    def flaky_init(project):
+        attempts.append(project)
+        if len(attempts) == 1:
+            raise RuntimeError("handshake failed")
+
+    monkeypatch.setattr(telemetry.weave, "init", flaky_init)
+    monkeypatch.setattr(telemetry, "_WEAVE_INIT_TASK", None)
+
+    with pytest.raises(RuntimeError):
+        await telemetry.init_weave()
+    await telemetry.init_weave()
+
+    assert len(attempts) == 2